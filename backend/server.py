@@ -749,7 +749,7 @@ async def load_components():
         # Force reload of components
         fritzing_service.loaded = False
         fritzing_service.components_cache = []
-        components = await fritzing_service.load_components()
+        components = await fritzing_service.load_components(refresh=True)
         return {"success": True, "message": f"Loaded {len(components)} components successfully"}
     except Exception as e:
         logger.error(f"Error loading components: {e}")
@@ -799,4 +799,4 @@ app.add_middleware(
 @app.on_event("shutdown")
 async def shutdown_event():
     # Cleanup resources if needed
-    pass
\ No newline at end of file
+    await fritzing_service.close()
\ No newline at end of file
@@ -1,19 +1,182 @@
 import os
 import json
-import xml.etree.ElementTree as ET
+import hashlib
 import asyncio
+import functools
 import aiohttp
 import re
+from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 import logging
 
+import numpy as np
+from lxml import etree as ET
+
 logger = logging.getLogger(__name__)
 
+# Shared parser: no DTD loading or entity expansion, whitespace-only text dropped
+_XML_PARSER = ET.XMLParser(huge_tree=False, remove_blank_text=True, resolve_entities=False)
+
+# SVG element types that can carry a connector position
+_CONNECTOR_TAGS = ('{*}rect', '{*}circle', '{*}ellipse', '{*}path', '{*}line')
+
+# Bump when the serialized component layout changes to invalidate old caches
+_DISK_CACHE_VERSION = 5
+
+# Position attributes for each non-path connector element type
+_POSITION_ATTRS = {'rect': ('x', 'y'), 'circle': ('cx', 'cy'), 'ellipse': ('cx', 'cy'), 'line': ('x1', 'y1')}
+
+# SVG number token; '.5.5' is two numbers and '3.6-0.6' is '3.6' followed by '-0.6'
+_SVG_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# Initial moveTo of an SVG path (a leading relative 'm' is absolute per the spec)
+_PATH_MOVETO = re.compile(rf'\s*[Mm]\s*({_SVG_NUMBER})\s*,?\s*({_SVG_NUMBER})')
+
+# Position used when a connector element has no usable coordinates
+_ORIGIN = ('0', '0')
+
+# Leading number of a length such as '0.4in'
+_NUM = re.compile(r'[\d.]+')
+
+# Filename terms for each Fritzing-style category, in priority order
+_CATEGORY_TERMS = (
+    ('Basic', ('resistor', 'capacitor', 'inductor')),
+    ('Semiconductors', ('led', 'diode', 'transistor')),
+    ('Microcontrollers', ('arduino', 'raspberry', 'microcontroller')),
+    ('Sensors', ('sensor', 'accelerometer', 'gyro')),
+    ('Actuators', ('motor', 'servo', 'actuator')),
+    ('Input', ('switch', 'button', 'potentiometer')),
+    ('Output', ('speaker', 'display', 'lcd')),
+    ('Connectors', ('connector', 'header', 'pin')),
+    ('Power', ('power', 'battery', 'regulator')),
+)
+_TERM_TO_CATEGORY = {term: category for category, terms in _CATEGORY_TERMS for term in terms}
+_CATEGORY_PRIORITY = {category: i for i, (category, _) in enumerate(_CATEGORY_TERMS)}
+
+# Zero-width lookahead so one scan reports every term, including overlapping ones
+_CATEGORY_RE = re.compile('(?=(' + '|'.join(_TERM_TO_CATEGORY) + '))')
+
+# Opening root tag of an SVG document, searched for within its first _SVG_HEAD_SIZE characters
+_SVG_HEAD_SIZE = 2048
+_SVG_OPEN_TAG = re.compile(r'<svg\b[^>]*>')
+_XML_ATTR = re.compile(r'([\w:.-]+)\s*=\s*(["\'])(.*?)\2', re.S)
+
+# Top-level .fzp elements read by parse_fzp_file
+_FZP_SECTIONS = frozenset(('title', 'description', 'tags', 'views', 'connectors', 'properties'))
+
+def _normalize_connector_id(connector_id: str) -> str:
+    """Reduce an fzp or SVG connector ID (e.g. 'connector3pin') to its key ('3')"""
+    return connector_id.removeprefix('connector').removesuffix('pin').removesuffix('pad')
+
+def _svg_dimensions(viewbox: Optional[str], width: str, height: str) -> Tuple[float, float]:
+    """Compute SVG dimensions from the root element's viewBox/width/height attributes"""
+    # Try viewBox first
+    if viewbox:
+        parts = viewbox.split()
+        if len(parts) == 4:
+            return float(parts[2]), float(parts[3])
+    
+    # Parse dimensions (remove units like 'in')
+    width_match = _NUM.search(str(width))
+    height_match = _NUM.search(str(height))
+    
+    if width_match and height_match:
+        w = float(width_match.group())
+        h = float(height_match.group())
+        
+        # Convert inches to pixels if needed (72 DPI)
+        if 'in' in str(width):
+            w *= 72
+        if 'in' in str(height):
+            h *= 72
+            
+        return w, h
+    
+    # Default Fritzing dimensions
+    return 72.0, 93.6
+
+@functools.lru_cache(maxsize=2048)
+def _svg_tag_dimensions(svg_tag: str) -> Tuple[float, float]:
+    """Compute SVG dimensions from the text of the opening <svg ...> tag"""
+    attrs = {name: value for name, _, value in _XML_ATTR.findall(svg_tag)}
+    return _svg_dimensions(attrs.get('viewBox'), attrs.get('width', '72'), attrs.get('height', '93.6'))
+
+def _svg_filenames(component_id: str, svg_type: str) -> Tuple[str, str, str]:
+    """Candidate SVG filenames for a component, in lookup order"""
+    return (
+        f'{component_id}.svg',
+        f'{component_id}_{svg_type}.svg',
+        f'{component_id}_breadboard.svg'
+    )
+
+def _read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _float_pair(pair: Tuple[str, str]) -> Tuple[float, float]:
+    """Convert an (x, y) string pair, using the origin if either value is malformed"""
+    try:
+        return float(pair[0]), float(pair[1])
+    except ValueError:
+        return 0.0, 0.0
+
+def _empty_xy() -> np.ndarray:
+    return np.zeros((0, 2), dtype=np.float32)
+
+@dataclass(eq=False)
+class FritzingConnectorSet:
+    """Connectors of one component, stored as parallel columns with an (N, 2) position array"""
+    ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    svg_ids: List[str] = field(default_factory=list)
+    xy: np.ndarray = field(default_factory=_empty_xy)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def to_dict(self, svg_width: Optional[float] = None, svg_height: Optional[float] = None) -> List[Dict]:
+        """Rebuild the list-of-dicts layout used by the API"""
+        connectors = []
+        for connector_id, name, description, connector_type, svg_id, (x, y) in zip(
+                self.ids, self.names, self.descriptions, self.types, self.svg_ids, self.xy.tolist()):
+            connector = {
+                'id': connector_id,
+                'name': name,
+                'description': description,
+                'type': connector_type,
+                'svgId': svg_id,
+                'x': x,
+                'y': y
+            }
+            if svg_width is not None:
+                connector['svgWidth'] = svg_width
+                connector['svgHeight'] = svg_height
+            connectors.append(connector)
+        return connectors
+
+    @classmethod
+    def from_dict(cls, connectors: List[Dict]) -> 'FritzingConnectorSet':
+        return cls(
+            ids=[c['id'] for c in connectors],
+            names=[c['name'] for c in connectors],
+            descriptions=[c['description'] for c in connectors],
+            types=[c['type'] for c in connectors],
+            svg_ids=[c['svgId'] for c in connectors],
+            xy=np.asarray([(c['x'], c['y']) for c in connectors], dtype=np.float32).reshape(-1, 2)
+        )
+
 class FritzingComponent:
+    __slots__ = ('id', 'title', 'description', 'category', 'tags', 'icon_url',
+                 'breadboard_url', 'connectors', 'properties', 'svg_width', 'svg_height')
+
     def __init__(self, component_id: str, title: str, description: str, category: str, 
                  tags: List[str], icon_url: str, breadboard_url: str, 
-                 connectors: List[Dict], properties: Dict[str, Any]):
+                 connectors: FritzingConnectorSet, properties: Dict[str, Any],
+                 svg_width: Optional[float] = None, svg_height: Optional[float] = None):
         self.id = component_id
         self.title = title
         self.description = description
@@ -23,6 +186,9 @@ class FritzingComponent:
         self.breadboard_url = breadboard_url
         self.connectors = connectors
         self.properties = properties
+        # Breadboard SVG size, known once connector positions are resolved
+        self.svg_width = svg_width
+        self.svg_height = svg_height
 
     def to_dict(self):
         return {
@@ -33,19 +199,214 @@ class FritzingComponent:
             'tags': self.tags,
             'iconUrl': self.icon_url,
             'breadboardUrl': self.breadboard_url,
-            'connectors': self.connectors,
+            'connectors': self.connectors.to_dict(self.svg_width, self.svg_height),
             'properties': self.properties
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FritzingComponent':
+        sized = next((c for c in data['connectors'] if 'svgWidth' in c), None)
+        return cls(
+            component_id=data['id'],
+            title=data['title'],
+            description=data['description'],
+            category=data['category'],
+            tags=data['tags'],
+            icon_url=data['iconUrl'],
+            breadboard_url=data['breadboardUrl'],
+            connectors=FritzingConnectorSet.from_dict(data['connectors']),
+            properties=data['properties'],
+            svg_width=sized['svgWidth'] if sized else None,
+            svg_height=sized['svgHeight'] if sized else None
+        )
+
+def _parse_fzp_sync(file_path: str, repository: str, base_url: str) -> Optional[Dict[str, Any]]:
+    """Parse a .fzp file into FritzingComponent keyword arguments (runs in a worker thread)"""
+    try:
+        # Stream the file, keeping only the top-level sections we read
+        sections = {}
+        for _, elem in ET.iterparse(file_path, events=('end',), huge_tree=False,
+                                    remove_blank_text=True, resolve_entities=False):
+            parent = elem.getparent()
+            if parent is None or parent.getparent() is not None:
+                continue
+            if elem.tag in _FZP_SECTIONS and elem.tag not in sections:
+                sections[elem.tag] = elem
+            else:
+                elem.clear()
+        
+        # Extract basic information
+        title_elem = sections.get('title')
+        title = title_elem.text if title_elem is not None else Path(file_path).stem
+        
+        description_elem = sections.get('description')
+        description = description_elem.text if description_elem is not None else ''
+        
+        category = _extract_category(file_path)
+        
+        # Extract tags
+        tags = []
+        tags_elem = sections.get('tags')
+        if tags_elem is not None:
+            for tag in tags_elem.findall('tag'):
+                if tag.text:
+                    tags.append(tag.text)
+        
+        # Extract component ID from filename
+        component_id = Path(file_path).stem
+        
+        # Create SVG URLs
+        icon_url = f'{base_url}/svg/{repository}/icon/{component_id}.svg'
+        breadboard_url = f'{base_url}/svg/{repository}/breadboard/{component_id}.svg'
+        
+        # Parse views for actual image paths
+        views_elem = sections.get('views')
+        if views_elem is not None:
+            icon_view = views_elem.find('iconView')
+            if icon_view is not None:
+                layers = icon_view.find('layers')
+                if layers is not None:
+                    layer = layers.find('layer')
+                    if layer is not None and 'image' in layer.attrib:
+                        icon_url = f'{base_url}/svg/{repository}/{layer.attrib["image"]}'
+            
+            breadboard_view = views_elem.find('breadboardView')
+            if breadboard_view is not None:
+                layers = breadboard_view.find('layers')
+                if layers is not None:
+                    layer = layers.find('layer')
+                    if layer is not None and 'image' in layer.attrib:
+                        breadboard_url = f'{base_url}/svg/{repository}/{layer.attrib["image"]}'
+        
+        # Parse connectors
+        connectors = _parse_connectors(sections.get('connectors'))
+        
+        # Parse properties
+        properties = _parse_properties(sections.get('properties'))
+        
+        return {
+            'component_id': component_id,
+            'title': title,
+            'description': description,
+            'category': category,
+            'tags': tags,
+            'icon_url': icon_url,
+            'breadboard_url': breadboard_url,
+            'connectors': connectors,
+            'properties': properties
+        }
+    
+    except Exception as e:
+        logger.error(f'Error parsing {file_path}: {e}')
+        return None
+
+def _extract_category(file_path: str) -> str:
+    """Extract category from file path or component name"""
+    filename = Path(file_path).stem.lower()
+    
+    # Match Fritzing-style categories based on component names
+    terms = _CATEGORY_RE.findall(filename)
+    if not terms:
+        return 'Miscellaneous'
+    
+    # When several categories match, the earliest-listed one wins
+    return min((_TERM_TO_CATEGORY[term] for term in terms), key=_CATEGORY_PRIORITY.__getitem__)
+
+def _parse_connectors(connectors_elem) -> FritzingConnectorSet:
+    """Parse connector information from the .fzp file"""
+    if connectors_elem is None:
+        return FritzingConnectorSet()
+    
+    ids, names, descriptions, types, svg_ids = [], [], [], [], []
+    
+    for connector in connectors_elem.findall('connector'):
+        description_elem = connector.find('description')
+        description = description_elem.text if description_elem is not None else ''
+        
+        # Extract SVG ID from breadboard view if available
+        svg_id = ''
+        views = connector.find('views')
+        if views is not None:
+            breadboard_view = views.find('breadboardView')
+            if breadboard_view is not None:
+                p_elem = breadboard_view.find('p')
+                if p_elem is not None:
+                    svg_id = p_elem.get('svgId', '')
+        
+        ids.append(connector.get('id', ''))
+        names.append(connector.get('name', ''))
+        descriptions.append(description)
+        types.append(connector.get('type', 'unknown'))
+        svg_ids.append(svg_id)
+    
+    return FritzingConnectorSet(
+        ids=ids,
+        names=names,
+        descriptions=descriptions,
+        types=types,
+        svg_ids=svg_ids,
+        # Positions are filled in from SVG parsing
+        xy=np.zeros((len(ids), 2), dtype=np.float32)
+    )
+
+def _parse_properties(properties_elem) -> Dict[str, Any]:
+    """Parse properties from the .fzp file"""
+    if properties_elem is None:
+        return {}
+    
+    properties = {}
+    
+    for prop in properties_elem.findall('property'):
+        name = prop.get('name', '')
+        value = prop.get('value', prop.text or '')
+        if name:
+            properties[name] = value
+    
+    return properties
+
 class FritzingService:
     def __init__(self):
         self.repo_path = './backend/fritzing-parts'
         self.base_url = 'https://raw.githubusercontent.com/fritzing/fritzing-parts/develop'
+        self.cache_path = './backend/.fritzing_cache.json'
         self.components_cache = []
         self.loaded = False
+        # Connector positions of all loaded components in one (total_pins, 2) array;
+        # component i owns rows connector_offsets[i]:connector_offsets[i + 1]
+        self.all_xy = _empty_xy()
+        self.connector_offsets = np.zeros(1, dtype=np.intp)
+        self._repo_checked = False
+        # Caps concurrent per-component work (and the SVG fetches it triggers)
+        self._semaphore = asyncio.Semaphore(64)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Preloaded SVG text keyed by (svg_type, filename)
+        self._svg_cache: Dict[Tuple[str, str], str] = {}
+        # Per svg_type directory listing, {filename: path}, built on first use
+        self._svg_index: Dict[str, Dict[str, str]] = {}
+        # Failed (non-404) SVG lookups, so a load can tell whether its results are complete
+        self._svg_errors = 0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=256, limit_per_host=64, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+
+    async def close(self):
+        """Release the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def ensure_repository(self):
         """Ensure the fritzing-parts repository exists"""
+        if self._repo_checked:
+            return
+        self._repo_checked = True
+        
         if os.path.exists(self.repo_path):
             logger.info('Fritzing repository already exists')
             return
@@ -64,203 +425,216 @@ class FritzingService:
         except Exception as e:
             logger.error(f'Error setting up fritzing repository: {e}')
 
-    async def load_components(self) -> List[FritzingComponent]:
+    async def load_components(self, refresh: bool = False) -> List[FritzingComponent]:
         """Load all components from the fritzing-parts repository"""
-        if self.loaded and self.components_cache:
+        if self.loaded and self.components_cache and not refresh:
             return self.components_cache
 
+        if refresh:
+            self._repo_checked = False
+            self._svg_cache.clear()
+            self._svg_index.clear()
         await self.ensure_repository()
         
-        components = []
-        
         # Load from all three repositories: core, contrib, user
         repositories = ['core', 'contrib', 'user']
         
+        repo_files = {}
         for repo in repositories:
             repo_path = os.path.join(self.repo_path, repo)
             if os.path.exists(repo_path):
                 try:
-                    fzp_files = await self.find_fzp_files(repo_path)
-                    
-                    # Process up to 50 components per repository to avoid overwhelming
-                    for fzp_file in fzp_files[:50]:
-                        try:
-                            component = await self.parse_fzp_file(fzp_file, repo)
-                            if component:
-                                updated_component = await self.update_component_with_connector_positions(component)
-                                components.append(updated_component)
-                        except Exception as e:
-                            logger.error(f'Error parsing {fzp_file}: {e}')
+                    repo_files[repo] = await asyncio.to_thread(self.find_fzp_files, repo_path)
                 except Exception as e:
                     logger.error(f'Error loading from {repo} repository: {e}')
+        
+        # Process up to 50 components per repository to avoid overwhelming
+        batches = {repo: fzp_files[:50] for repo, fzp_files in repo_files.items()}
+        component_ids = [Path(fzp_file).stem for batch in batches.values() for fzp_file in batch]
+        
+        # Reuse the on-disk cache when no .fzp file or breadboard SVG has changed since it was written
+        svg_paths = await asyncio.to_thread(self._resolve_svg_paths, component_ids, 'breadboard')
+        fingerprint = await asyncio.to_thread(self._fingerprint, repo_files, svg_paths)
+        if not refresh:
+            cached = await asyncio.to_thread(self._read_disk_cache, fingerprint)
+            if cached is not None:
+                self._pack_connector_positions(cached)
+                self.components_cache = cached
+                self.loaded = True
+                logger.info(f'Loaded {len(cached)} components from {self.cache_path}')
+                return cached
+        
+        await self._preload_svgs(component_ids)
+        
+        components = []
+        svg_errors = self._svg_errors
+        parse_errors = 0
+        
+        for repo, batch in batches.items():
+            try:
+                results = await asyncio.gather(
+                    *[self._process_one(fzp_file, repo) for fzp_file in batch],
+                    return_exceptions=True
+                )
+                for fzp_file, result in zip(batch, results):
+                    if isinstance(result, BaseException):
+                        logger.error(f'Error parsing {fzp_file}: {result}')
+                        parse_errors += 1
+                    elif result:
+                        components.append(result)
+            except Exception as e:
+                logger.error(f'Error loading from {repo} repository: {e}')
+                parse_errors += 1
 
+        self._pack_connector_positions(components)
         self.components_cache = components
         self.loaded = True
         logger.info(f'Loaded {len(components)} components from fritzing-parts')
+        
+        # Don't persist components or positions that are missing only because of a transient failure
+        if parse_errors:
+            logger.warning(f'Not writing component cache: {parse_errors} component(s) failed to load')
+        elif self._svg_errors != svg_errors:
+            logger.warning('Not writing component cache: some SVGs could not be fetched')
+        else:
+            await asyncio.to_thread(self._write_disk_cache, fingerprint, components)
         return components
 
-    async def find_fzp_files(self, directory: str) -> List[str]:
+    def _pack_connector_positions(self, components: List[FritzingComponent]):
+        """Concatenate connector positions into all_xy and re-point each component at its slice"""
+        self.connector_offsets = np.cumsum([0] + [len(c.connectors) for c in components], dtype=np.intp)
+        if components:
+            self.all_xy = np.concatenate([c.connectors.xy for c in components]).astype(np.float32, copy=False)
+        else:
+            self.all_xy = _empty_xy()
+        
+        for component, start, end in zip(components, self.connector_offsets[:-1], self.connector_offsets[1:]):
+            component.connectors.xy = self.all_xy[start:end]
+
+    def _resolve_svg_paths(self, component_ids: List[str], svg_type: str) -> List[str]:
+        """Return the SVG directory and the local SVG files the given components resolve to"""
+        svg_index = self._get_svg_index(svg_type)
+        svg_paths = [os.path.join(self.repo_path, 'svg', 'core', svg_type)]
+        for component_id in component_ids:
+            svg_paths.extend(svg_index[name] for name in _svg_filenames(component_id, svg_type)
+                             if name in svg_index)
+        return svg_paths
+
+    def _fingerprint(self, repo_files: Dict[str, List[str]], svg_paths: List[str]) -> str:
+        """Hash the discovered .fzp and resolved SVG paths with their modification times"""
+        digest = hashlib.sha1(f'v{_DISK_CACHE_VERSION}'.encode())
+        paths = {path for files in repo_files.values() for path in files}
+        paths.update(svg_paths)
+        for path in sorted(paths):
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            digest.update(f'{path}\0{mtime}\n'.encode())
+        return digest.hexdigest()
+
+    def _read_disk_cache(self, fingerprint: str) -> Optional[List[FritzingComponent]]:
+        """Return cached components if the cache matches the fingerprint"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('fingerprint') != fingerprint:
+                return None
+            return [FritzingComponent.from_dict(c) for c in data['components']]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f'Ignoring unreadable component cache {self.cache_path}: {e}')
+            return None
+
+    def _write_disk_cache(self, fingerprint: str, components: List[FritzingComponent]):
+        """Persist parsed components so the next start can skip parsing"""
+        tmp_path = f'{self.cache_path}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'fingerprint': fingerprint,
+                    'components': [c.to_dict() for c in components]
+                }, f)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f'Could not write component cache {self.cache_path}: {e}')
+
+    async def _process_one(self, fzp_file: str, repository: str) -> Optional[FritzingComponent]:
+        """Parse one .fzp file and resolve its connector positions"""
+        async with self._semaphore:
+            component = await self.parse_fzp_file(fzp_file, repository)
+            if component:
+                return await self.update_component_with_connector_positions(component)
+        return None
+
+    def find_fzp_files(self, directory: str) -> List[str]:
         """Find all .fzp files in a directory recursively"""
         files = []
+        stack = [directory]
         
-        try:
-            for root, dirs, filenames in os.walk(directory):
-                for filename in filenames:
-                    if filename.endswith('.fzp'):
-                        files.append(os.path.join(root, filename))
-        except Exception as e:
-            logger.error(f'Error reading directory {directory}: {e}')
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith('.fzp'):
+                            files.append(entry.path)
+            except OSError as e:
+                logger.error(f'Error reading directory {current}: {e}')
         
         return files
 
     async def parse_fzp_file(self, file_path: str, repository: str = 'core') -> Optional[FritzingComponent]:
-        """Parse a .fzp file and extract component information"""
-        try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Extract basic information
-            title_elem = root.find('title')
-            title = title_elem.text if title_elem is not None else os.path.basename(file_path, '.fzp')
-            
-            description_elem = root.find('description')
-            description = description_elem.text if description_elem is not None else ''
-            
-            category = self.extract_category(file_path)
-            
-            # Extract tags
-            tags = []
-            tags_elem = root.find('tags')
-            if tags_elem is not None:
-                for tag in tags_elem.findall('tag'):
-                    if tag.text:
-                        tags.append(tag.text)
-            
-            # Extract component ID from filename
-            component_id = os.path.basename(file_path, '.fzp')
-            
-            # Create SVG URLs
-            icon_url = f'{self.base_url}/svg/{repository}/icon/{component_id}.svg'
-            breadboard_url = f'{self.base_url}/svg/{repository}/breadboard/{component_id}.svg'
-            
-            # Parse views for actual image paths
-            views_elem = root.find('views')
-            if views_elem is not None:
-                icon_view = views_elem.find('iconView')
-                if icon_view is not None:
-                    layers = icon_view.find('layers')
-                    if layers is not None:
-                        layer = layers.find('layer')
-                        if layer is not None and 'image' in layer.attrib:
-                            icon_url = f'{self.base_url}/svg/{repository}/{layer.attrib["image"]}'
-                
-                breadboard_view = views_elem.find('breadboardView')
-                if breadboard_view is not None:
-                    layers = breadboard_view.find('layers')
-                    if layers is not None:
-                        layer = layers.find('layer')
-                        if layer is not None and 'image' in layer.attrib:
-                            breadboard_url = f'{self.base_url}/svg/{repository}/{layer.attrib["image"]}'
-            
-            # Parse connectors
-            connectors = self.parse_connectors(root.find('connectors'))
-            
-            # Parse properties
-            properties = self.parse_properties(root.find('properties'))
-            
-            return FritzingComponent(
-                component_id=component_id,
-                title=title,
-                description=description,
-                category=category,
-                tags=tags,
-                icon_url=icon_url,
-                breadboard_url=breadboard_url,
-                connectors=connectors,
-                properties=properties
-            )
-            
-        except Exception as e:
-            logger.error(f'Error parsing {file_path}: {e}')
-            return None
+        """Parse a .fzp file in a worker thread and build the component"""
+        data = await asyncio.to_thread(_parse_fzp_sync, file_path, repository, self.base_url)
+        return FritzingComponent(**data) if data else None
 
-    def extract_category(self, file_path: str) -> str:
-        """Extract category from file path or component name"""
-        filename = os.path.basename(file_path, '.fzp').lower()
+    async def _preload_svgs(self, component_ids: List[str], svg_type: str = 'breadboard'):
+        """Read the SVGs of the given components into _svg_cache in one concurrent pass"""
+        wanted = {filename for component_id in component_ids
+                  for filename in _svg_filenames(component_id, svg_type)}
         
-        # Match Fritzing-style categories based on component names
-        if any(term in filename for term in ['resistor', 'capacitor', 'inductor']):
-            return 'Basic'
-        elif any(term in filename for term in ['led', 'diode', 'transistor']):
-            return 'Semiconductors'
-        elif any(term in filename for term in ['arduino', 'raspberry', 'microcontroller']):
-            return 'Microcontrollers'
-        elif any(term in filename for term in ['sensor', 'accelerometer', 'gyro']):
-            return 'Sensors'
-        elif any(term in filename for term in ['motor', 'servo', 'actuator']):
-            return 'Actuators'
-        elif any(term in filename for term in ['switch', 'button', 'potentiometer']):
-            return 'Input'
-        elif any(term in filename for term in ['speaker', 'display', 'lcd']):
-            return 'Output'
-        elif any(term in filename for term in ['connector', 'header', 'pin']):
-            return 'Connectors'
-        elif any(term in filename for term in ['power', 'battery', 'regulator']):
-            return 'Power'
-        else:
-            return 'Miscellaneous'
+        svg_index = await asyncio.to_thread(self._get_svg_index, svg_type)
+        entries = [(name, path) for name, path in svg_index.items()
+                   if name in wanted and (svg_type, name) not in self._svg_cache]
+        contents = await asyncio.gather(
+            *[asyncio.to_thread(_read_text, path) for _, path in entries],
+            return_exceptions=True
+        )
+        for (name, path), content in zip(entries, contents):
+            if isinstance(content, BaseException):
+                logger.error(f'Error reading {path}: {content}')
+            else:
+                self._svg_cache[(svg_type, name)] = content
 
-    def parse_connectors(self, connectors_elem) -> List[Dict]:
-        """Parse connector information from the .fzp file"""
-        if connectors_elem is None:
-            return []
-        
-        connectors = []
-        
-        for connector in connectors_elem.findall('connector'):
-            connector_id = connector.get('id', '')
-            connector_name = connector.get('name', '')
-            connector_type = connector.get('type', 'unknown')
-            
-            description_elem = connector.find('description')
-            description = description_elem.text if description_elem is not None else ''
-            
-            # Extract SVG ID from breadboard view if available
-            svg_id = ''
-            views = connector.find('views')
-            if views is not None:
-                breadboard_view = views.find('breadboardView')
-                if breadboard_view is not None:
-                    p_elem = breadboard_view.find('p')
-                    if p_elem is not None:
-                        svg_id = p_elem.get('svgId', '')
-            
-            connectors.append({
-                'id': connector_id,
-                'name': connector_name,
-                'description': description,
-                'type': connector_type,
-                'svgId': svg_id,
-                'x': 0,  # Will be updated from SVG parsing
-                'y': 0   # Will be updated from SVG parsing
-            })
-        
-        return connectors
+    def _get_svg_index(self, svg_type: str) -> Dict[str, str]:
+        """Return {filename: path} for an SVG directory, scanning it once"""
+        svg_index = self._svg_index.get(svg_type)
+        if svg_index is None:
+            svg_directory = os.path.join(self.repo_path, 'svg', 'core', svg_type)
+            try:
+                with os.scandir(svg_directory) as entries:
+                    svg_index = {entry.name: entry.path for entry in entries if entry.is_file()}
+            except FileNotFoundError:
+                # Not cached, so unknown svg_type values cannot grow the index
+                return {}
+            except OSError as e:
+                logger.warning(f'Could not scan {svg_directory}: {e}')
+                return {}
+            self._svg_index[svg_type] = svg_index
+        return svg_index
 
-    def parse_properties(self, properties_elem) -> Dict[str, Any]:
-        """Parse properties from the .fzp file"""
-        if properties_elem is None:
-            return {}
-        
-        properties = {}
-        
-        for prop in properties_elem.findall('property'):
-            name = prop.get('name', '')
-            value = prop.get('value', prop.text or '')
-            if name:
-                properties[name] = value
-        
-        return properties
+    def _read_local_svg(self, component_id: str, svg_type: str) -> Optional[str]:
+        """Read a component SVG from the local repository, or None if absent"""
+        svg_index = self._get_svg_index(svg_type)
+        svg_path = next((svg_index[name] for name in _svg_filenames(component_id, svg_type)
+                         if name in svg_index), None)
+        if svg_path is None:
+            return None
+        return _read_text(svg_path)
 
     async def get_component_svg(self, component_id: str, svg_type: str = 'breadboard') -> Optional[str]:
         """Get SVG content for a component"""
@@ -268,103 +642,90 @@ class FritzingService:
             # Try to get from local repository first
             await self.ensure_repository()
             
-            possible_filenames = [
-                f'{component_id}.svg',
-                f'{component_id}_{svg_type}.svg',
-                f'{component_id}_breadboard.svg'
-            ]
+            # Preloaded SVGs are served without any I/O
+            for filename in _svg_filenames(component_id, svg_type):
+                content = self._svg_cache.get((svg_type, filename))
+                if content is not None:
+                    return content
             
-            svg_directory = os.path.join(self.repo_path, 'svg', 'core', svg_type)
-            
-            if os.path.exists(svg_directory):
-                for filename in possible_filenames:
-                    svg_path = os.path.join(svg_directory, filename)
-                    if os.path.exists(svg_path):
-                        with open(svg_path, 'r', encoding='utf-8') as f:
-                            return f.read()
+            content = await asyncio.to_thread(self._read_local_svg, component_id, svg_type)
+            if content is not None:
+                return content
             
             # Fallback: try to fetch from GitHub
             url = f'{self.base_url}/svg/core/{svg_type}/{component_id}.svg'
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        return await response.text()
+            session = await self._get_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return await response.text()
+                if response.status != 404:
+                    # Anything but "not found" may succeed on a later attempt
+                    self._svg_errors += 1
+                    logger.error(f'Error getting SVG for {component_id}: HTTP {response.status}')
                         
         except Exception as e:
+            self._svg_errors += 1
             logger.error(f'Error getting SVG for {component_id}: {e}')
         
         return None
 
-    async def parse_connector_positions(self, component_id: str, svg_content: str) -> List[Dict]:
-        """Parse connector positions from SVG content"""
+    async def parse_connector_positions(self, component_id: str, svg_content: str) -> Tuple[List[str], np.ndarray]:
+        """Parse connector IDs and an (N, 2) position array from SVG content"""
         try:
-            root = ET.fromstring(svg_content)
-            connectors = []
+            ids = []
+            coords = []
+            moveto = _PATH_MOVETO.match
+            position_attrs = _POSITION_ATTRS
             
-            # Find elements with IDs that look like connectors
-            for elem in root.iter():
-                elem_id = elem.get('id', '')
-                if 'connector' in elem_id.lower() and ('pin' in elem_id.lower() or 'pad' in elem_id.lower()):
-                    x, y = 0, 0
-                    
-                    # Extract position from various possible attributes
-                    if 'cx' in elem.attrib and 'cy' in elem.attrib:
-                        x = float(elem.attrib['cx'])
-                        y = float(elem.attrib['cy'])
-                    elif 'x' in elem.attrib and 'y' in elem.attrib:
-                        x = float(elem.attrib['x'])
-                        y = float(elem.attrib['y'])
-                    elif 'x1' in elem.attrib and 'y1' in elem.attrib:
-                        x = float(elem.attrib['x1'])
-                        y = float(elem.attrib['y1'])
-                    elif 'd' in elem.attrib:
-                        # Parse path data for moveTo command
-                        path_match = re.search(r'M\s*([\d.-]+)\s*,?\s*([\d.-]+)', elem.attrib['d'])
-                        if path_match:
-                            x = float(path_match.group(1))
-                            y = float(path_match.group(2))
+            # Stream only connector-capable elements and look for connector IDs
+            context = ET.iterparse(BytesIO(svg_content.encode()), events=('end',), tag=_CONNECTOR_TAGS,
+                                   huge_tree=False, remove_blank_text=True, resolve_entities=False)
+            for _, elem in context:
+                get = elem.get
+                elem_id = get('id', '')
+                if elem_id.startswith('connector') and ('pin' in elem_id or 'pad' in elem_id):
+                    # Collect the raw coordinate strings used by this element type
+                    tag = elem.tag.rpartition('}')[2]
+                    if tag == 'path':
+                        # Parse path data for the initial moveTo command
+                        path_match = moveto(get('d', ''))
+                        coords.append(path_match.groups() if path_match else _ORIGIN)
+                    else:
+                        # A missing coordinate attribute defaults to 0 per the SVG spec
+                        x_attr, y_attr = position_attrs[tag]
+                        coords.append((get(x_attr, '0'), get(y_attr, '0')))
                     
                     # Clean up the connector ID
-                    base_id = elem_id.replace('pin', '').replace('pad', '')
-                    connectors.append({'id': base_id, 'x': x, 'y': y})
+                    ids.append(elem_id.replace('pin', '').replace('pad', ''))
+                
+                # Release the element and any already-processed siblings
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
             
-            return connectors
+            # Convert every coordinate string to float32 in a single NumPy call
+            try:
+                xy = np.array(coords, dtype=np.float32)
+            except ValueError:
+                # A malformed coordinate only resets its own element to the origin
+                xy = np.array([_float_pair(pair) for pair in coords], dtype=np.float32)
+            return ids, xy.reshape(-1, 2)
             
         except Exception as e:
             logger.error(f'Error parsing SVG connector positions for {component_id}: {e}')
-            return []
+            return [], _empty_xy()
 
-    async def get_svg_dimensions(self, svg_content: str) -> Tuple[float, float]:
+    @staticmethod
+    def get_svg_dimensions(svg_content: str) -> Tuple[float, float]:
         """Get SVG dimensions"""
         try:
-            root = ET.fromstring(svg_content)
-            
-            # Try viewBox first
-            viewbox = root.get('viewBox')
-            if viewbox:
-                parts = viewbox.split()
-                if len(parts) == 4:
-                    return float(parts[2]), float(parts[3])
-            
-            # Try width/height attributes
-            width = root.get('width', '72')
-            height = root.get('height', '93.6')
-            
-            # Parse dimensions (remove units like 'in')
-            width_match = re.search(r'([\d.]+)', str(width))
-            height_match = re.search(r'([\d.]+)', str(height))
+            # Only the root tag is needed, so read it from the head of the document when possible
+            tag_match = _SVG_OPEN_TAG.search(svg_content, 0, _SVG_HEAD_SIZE)
+            if tag_match:
+                return _svg_tag_dimensions(tag_match.group())
             
-            if width_match and height_match:
-                w = float(width_match.group(1))
-                h = float(height_match.group(1))
-                
-                # Convert inches to pixels if needed (72 DPI)
-                if 'in' in str(width):
-                    w *= 72
-                if 'in' in str(height):
-                    h *= 72
-                    
-                return w, h
+            root = ET.fromstring(svg_content.encode(), _XML_PARSER)
+            return _svg_dimensions(root.get('viewBox'), root.get('width', '72'), root.get('height', '93.6'))
                 
         except Exception as e:
             logger.error(f'Error parsing SVG dimensions: {e}')
@@ -374,46 +735,45 @@ class FritzingService:
 
     async def update_component_with_connector_positions(self, component: FritzingComponent) -> FritzingComponent:
         """Update component with actual connector positions from SVG"""
+        # Without any breadboard svgId there is nothing to look up in the SVG
+        if not any(component.connectors.svg_ids):
+            return component
+        
         try:
             svg_content = await self.get_component_svg(component.id, 'breadboard')
             if svg_content:
-                svg_connectors = await self.parse_connector_positions(component.id, svg_content)
-                width, height = await self.get_svg_dimensions(svg_content)
+                svg_ids, svg_xy = await self.parse_connector_positions(component.id, svg_content)
+                if not svg_ids:
+                    return component
                 
-                # Update component connectors with positions
-                updated_connectors = []
-                for connector in component.connectors:
-                    # Try to match connector with SVG connector
-                    svg_connector = None
-                    for sc in svg_connectors:
-                        if (connector['svgId'] and sc['id'] == connector['svgId']) or \
-                           (sc['id'] == connector['id']) or \
-                           (sc['id'] in connector['id']) or \
-                           (connector['id'] in sc['id']):
-                            svg_connector = sc
-                            break
-                    
-                    updated_connector = connector.copy()
-                    if svg_connector:
-                        updated_connector['x'] = svg_connector['x']
-                        updated_connector['y'] = svg_connector['y']
-                    
-                    updated_connector['svgWidth'] = width
-                    updated_connector['svgHeight'] = height
-                    updated_connectors.append(updated_connector)
+                width, height = self.get_svg_dimensions(svg_content)
                 
-                # Create new component with updated connectors
-                return FritzingComponent(
-                    component_id=component.id,
-                    title=component.title,
-                    description=component.description,
-                    category=component.category,
-                    tags=component.tags,
-                    icon_url=component.icon_url,
-                    breadboard_url=component.breadboard_url,
-                    connectors=updated_connectors,
-                    properties=component.properties
-                )
+                # Index SVG connectors by exact and normalized ID, keeping the first occurrence
+                svg_by_id, svg_by_norm = {}, {}
+                for i, svg_id in enumerate(svg_ids):
+                    svg_by_id.setdefault(svg_id, i)
+                    svg_by_norm.setdefault(_normalize_connector_id(svg_id), i)
+                
+                # Match each component connector to an SVG connector
+                connectors = component.connectors
+                matched_idx, src_idx = [], []
+                for i, (connector_id, svg_id) in enumerate(zip(connectors.ids, connectors.svg_ids)):
+                    # The declared svgId wins; strip it the same way the SVG IDs were stripped
+                    src = svg_by_id.get(svg_id.replace('pin', '').replace('pad', '')) if svg_id else None
+                    if src is None:
+                        src = svg_by_id.get(connector_id)
+                    if src is None and svg_id:
+                        src = svg_by_norm.get(_normalize_connector_id(svg_id))
+                    if src is None:
+                        src = svg_by_norm.get(_normalize_connector_id(connector_id))
+                    if src is not None:
+                        matched_idx.append(i)
+                        src_idx.append(src)
+                
+                # Update the component in place
+                if matched_idx:
+                    connectors.xy[matched_idx] = svg_xy[src_idx]
+                component.svg_width, component.svg_height = width, height
                 
         except Exception as e:
             logger.error(f'Error updating connector positions for {component.id}: {e}')
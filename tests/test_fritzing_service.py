@@ -0,0 +1,92 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'backend'))
+
+from services.fritzing_service import FritzingComponent, FritzingConnectorSet, FritzingService  # noqa: E402
+
+
+def _svg(*elements: str) -> str:
+    return '<svg xmlns="http://www.w3.org/2000/svg">' + ''.join(elements) + '</svg>'
+
+
+def _positions(svg_content: str):
+    return asyncio.run(FritzingService().parse_connector_positions('test', svg_content))
+
+
+@pytest.mark.parametrize('d, expected', [
+    ('m.5.5h.8v.8h-.8', (0.5, 0.5)),
+    ('M-13.669-18.798h2.665c0.156,0,0.283,0.127,0.283,0.284v2.665', (-13.669, -18.798)),
+    ('M3.6-0.65c-1.243,0-2.25,1.007-2.25,2.25v4', (3.6, -0.65)),
+    ('M 1e1, 2.5E-1 L 3 4', (10.0, 0.25)),
+])
+def test_path_moveto_numbers(d, expected):
+    ids, xy = _positions(_svg(f'<path id="connector0pin" d="{d}"/>'))
+    assert ids == ['connector0']
+    np.testing.assert_allclose(xy[0], expected, rtol=1e-6)
+
+
+def test_malformed_coordinate_only_resets_its_element():
+    ids, xy = _positions(_svg(
+        '<rect id="connector0pin" x="35" y="576,3959183673473"/>',
+        '<circle id="connector1pin" cx="4" cy="5"/>',
+    ))
+    assert ids == ['connector0', 'connector1']
+    np.testing.assert_allclose(xy, [(0, 0), (4, 5)])
+
+
+def test_missing_coordinate_attribute_defaults_to_zero():
+    ids, xy = _positions(_svg(
+        '<rect id="connector2pin" y="17.25" width="3" height="3"/>',
+        '<circle id="connector3pin" cx="8"/>',
+    ))
+    assert ids == ['connector2', 'connector3']
+    np.testing.assert_allclose(xy, [(0, 17.25), (8, 0)])
+
+
+def test_connector_sets_compare_by_identity():
+    connectors = FritzingConnectorSet(ids=['connector0'], xy=np.zeros((1, 2), dtype=np.float32))
+    assert connectors == connectors
+    assert connectors != FritzingConnectorSet(ids=['connector0'], xy=np.zeros((1, 2), dtype=np.float32))
+
+
+def test_failed_load_is_not_written_to_disk_cache(tmp_path, monkeypatch):
+    (tmp_path / 'core').mkdir()
+    (tmp_path / 'core' / 'part.fzp').write_text('<module/>')
+    service = FritzingService()
+    service.repo_path = str(tmp_path)
+    service.cache_path = str(tmp_path / 'cache.json')
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError('worker died')
+
+    monkeypatch.setattr(service, '_process_one', broken)
+    assert asyncio.run(service.load_components()) == []
+    assert not (tmp_path / 'cache.json').exists()
+
+
+def test_connector_positions_follow_declared_svg_id(monkeypatch):
+    svg_content = _svg(
+        '<rect id="connector0pin" x="1" y="10"/>',
+        '<rect id="connector1pin" x="2" y="20"/>',
+        '<rect id="connector2pad" x="3" y="30"/>',
+    )
+    connectors = FritzingConnectorSet(
+        ids=['connector0', 'connector1', 'connector2'],
+        names=['a', 'b', 'c'], descriptions=['', '', ''], types=['male'] * 3,
+        svg_ids=['connector1pin', 'connector0pin', ''],
+        xy=np.zeros((3, 2), dtype=np.float32),
+    )
+    component = FritzingComponent('part', 'Part', '', 'Other', [], '', '', connectors, {})
+    service = FritzingService()
+
+    async def svg(*args):
+        return svg_content
+
+    monkeypatch.setattr(service, 'get_component_svg', svg)
+    asyncio.run(service.update_component_with_connector_positions(component))
+    np.testing.assert_allclose(component.connectors.xy, [(2, 20), (1, 10), (3, 30)])